@@ -4,15 +4,18 @@
 import os
 import sys
 import unittest
+import unittest.mock
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 
 import http.server
+import json
 import threading
 
 from test.helper import FakeYDL, expect_dict, expect_value, http_server_port
 from yt_dlp.compat import compat_etree_fromstring
+from yt_dlp.dependencies import orjson
 from yt_dlp.extractor import YoutubeIE, get_info_extractor
 from yt_dlp.extractor.common import InfoExtractor
 from yt_dlp.utils import (
@@ -331,6 +334,55 @@ def test_download_json(self):
         self.assertRaises(ExtractorError, self.ie._download_json, uri, None)
         self.assertEqual(self.ie._download_json(uri, None, fatal=False), None)
 
+    _JSON_DOCUMENTS = (
+        '{"foo": [1, 2.5, null, true, "\\u00e9"]}',
+        # Integers outside the 64-bit range are turned into floats by orjson
+        '{"foo": 18446744073709551616, "bar": -9223372036854775809}',
+        # Control characters in strings are only accepted by the lenient decoder
+        '{"foo": "bar\tbaz"}',
+        '{"foo": NaN, "bar": 1e400}',
+        '{"foo": "1234567890123456789012345"}',
+    )
+
+    def _test_parse_json(self):
+        self.assertEqual(self.ie._parse_json('{"foo": [1, 2.5, null]}', None), {'foo': [1, 2.5, None]})
+        self.assertEqual(self.ie._parse_json('{"foo": "bar\tbaz"}', None), {'foo': 'bar\tbaz'})
+        self.assertEqual(self.ie._parse_json('{"foo": 18446744073709551616}', None), {'foo': 2 ** 64})
+        self.assertRaises(ExtractorError, self.ie._parse_json, '{"foo": invalid}', None)
+        self.assertEqual(self.ie._parse_json('{"foo": invalid}', None, fatal=False), None)
+
+    def test_parse_json(self):
+        self._test_parse_json()
+
+    def test_parse_json_without_orjson(self):
+        with unittest.mock.patch('yt_dlp.extractor.common.orjson', None):
+            self._test_parse_json()
+
+    def test_parse_json_orjson_usage(self):
+        def parse_json(document):
+            fake_orjson.loads.reset_mock()
+            return self.ie._parse_json(document, None), fake_orjson.loads.called
+
+        with unittest.mock.patch('yt_dlp.extractor.common.orjson') as fake_orjson:
+            fake_orjson.loads.side_effect = json.loads
+            fake_orjson.JSONDecodeError = json.JSONDecodeError
+            # Long digit runs inside strings do not affect number decoding
+            self.assertEqual(
+                parse_json('{"id": "1234567890123456789", "ids": ["12345678901234567890"]}'),
+                ({'id': '1234567890123456789', 'ids': ['12345678901234567890']}, True))
+            self.assertEqual(parse_json('{"foo": 123456789012345678}'), ({'foo': 123456789012345678}, True))
+            self.assertEqual(parse_json('{"foo": 1234567890123456789}'), ({'foo': 1234567890123456789}, False))
+            self.assertEqual(parse_json('[1, -12345678901234567890]'), ([1, -12345678901234567890], False))
+            self.assertEqual(parse_json('[\n12345678901234567890]'), ([12345678901234567890], False))
+
+    @unittest.skipUnless(orjson, 'orjson is not installed')
+    def test_parse_json_orjson_matches_lenient_decoder(self):
+        for document in self._JSON_DOCUMENTS:
+            with unittest.mock.patch('yt_dlp.extractor.common.orjson', None):
+                expected = self.ie._parse_json(document, None)
+            # Compare reprs since NaN does not compare equal to itself
+            self.assertEqual(repr(self.ie._parse_json(document, None)), repr(expected), document)
+
     def test_parse_html5_media_entries(self):
         # inline video tag
         expect_dict(
@@ -79,6 +79,11 @@
 except ImportError:
     curl_cffi = None
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from . import Cryptodome
 
 all_dependencies = {k: v for k, v in globals().items() if not k.startswith('_')}
@@ -28,6 +28,7 @@
     urllib_req_to_req,
 )
 from ..cookies import LenientSimpleCookie
+from ..dependencies import orjson
 from ..downloader.f4m import get_base_url, remove_encrypted_media
 from ..downloader.hls import HlsFD
 from ..networking import HEADRequest, Request
@@ -1087,6 +1088,16 @@ def _parse_xml(self, xml_string, video_id, transform_source=None, fatal=True, er
             self.__print_error('Failed to parse XML' if errnote is None else errnote, fatal, video_id, ve)
 
     def _parse_json(self, json_string, video_id, transform_source=None, fatal=True, errnote=None, **parser_kwargs):
+        # orjson silently turns integers outside the 64-bit range into floats, so documents
+        # with a number token of 19 or more digits are left to the stdlib decoder. Only
+        # unquoted numbers match, so e.g. snowflake ids in strings still use orjson.
+        # Anything orjson rejects is also retried with the lenient decoder below
+        if (orjson and transform_source is None and not parser_kwargs
+                and isinstance(json_string, str) and not re.search(r'[:,\[]\s*-?\d{19}', json_string)):
+            try:
+                return orjson.loads(json_string)
+            except orjson.JSONDecodeError:
+                pass
         try:
             return json.loads(
                 json_string, cls=LenientJSONDecoder, strict=False, transform_source=transform_source, **parser_kwargs)
@@ -17,6 +17,9 @@ class JTBCIE(InfoExtractor):
             |tv\.jtbc\.co\.kr/(?:replay|trailer|clip)/pr\d+/pm\d+
         )/(?P<id>(?:ep|vo)\d+)'''
     _GEO_COUNTRIES = ['KR']
+    _VOD_ID_RE = re.compile(r'data-vod="(VO\d+)"')
+    _PLAYLIST_RE = re.compile(r'/playlist(?:_pd\d+)?\.m3u8')
+    _DATE_RE = re.compile(r'\d{8}')
 
     _TESTS = [{
         'url': 'https://tv.jtbc.co.kr/replay/pr10011629/pm10067930/ep20216321/view',
@@ -87,7 +90,7 @@ def _real_extract(self, url):
             video_id = display_id.upper()
         else:
             webpage = self._download_webpage(url, display_id)
-            video_id = self._search_regex(r'data-vod="(VO\d+)"', webpage, 'vod id')
+            video_id = self._search_regex(self._VOD_ID_RE, webpage, 'vod id')
 
         playback_data = self._download_json(
             f'https://api.jtbc.co.kr/vod/{video_id}', video_id, note='Downloading VOD playback data')
@@ -98,7 +101,7 @@ def _real_extract(self, url):
 
         formats = []
         for stream_url in traverse_obj(playback_data, ('sources', 'HLS', ..., 'file', {url_or_none})):
-            stream_url = re.sub(r'/playlist(?:_pd\d+)?\.m3u8', '/index.m3u8', stream_url)
+            stream_url = self._PLAYLIST_RE.sub('/index.m3u8', stream_url)
             formats.extend(self._extract_m3u8_formats(stream_url, video_id, fatal=False))
 
         metadata = self._download_json(
@@ -111,7 +114,7 @@ def _real_extract(self, url):
                 'title': 'vodTitleView',
                 'series': 'programTitle',
                 'age_limit': ('watchAge', {int_or_none}),
-                'release_date': ('broadcastDate', {lambda x: re.match(r'\d{8}', x.replace('.', ''))}, 0),
+                'release_date': ('broadcastDate', {lambda x: self._DATE_RE.match(x.replace('.', ''))}, 0),
                 'description': 'episodeContents',
                 'thumbnail': ('imgFileUrl', {url_or_none}),
             })),
@@ -151,6 +154,6 @@ def _real_extract(self, url):
                 'rowCount': '10000',
             })
 
-        entries = [self.url_result(f'https://vod.jtbc.co.kr/player/program/{video_id}', JTBCIE, video_id)
-                   for video_id in traverse_obj(vod_list, ('programReplayVodList', ..., 'episodeId'))]
+        entries = (self.url_result(f'https://vod.jtbc.co.kr/player/program/{video_id}', JTBCIE, video_id)
+                   for video_id in traverse_obj(vod_list, ('programReplayVodList', ..., 'episodeId')))
         return self.playlist_result(entries, program_id)
@@ -56,8 +56,8 @@ def _real_extract(self, url):
             'episode_number': int_or_none(details.get('episodeNumber')),
             'episode_id': details.get('analyticsEpisodeTitle'),
             'duration': int_or_none(details.get('durationInMinutes'), invscale=60),
-            'view_count': details.get('viewCount'),
-            'categories': [details.get('videoCategory')],
+            'view_count': int_or_none(details.get('viewCount')),
+            'categories': traverse_obj(details, ('videoCategory', {str}, filter, all, filter)),
             'title': details.get('episodeTitle'),
             'description': clean_html(details.get('episodeDescription')),
             'thumbnail': details.get('episodelandscapeImgIxUrl'),
@@ -13,6 +13,7 @@
     get_element_html_by_class,
     int_or_none,
     join_nonempty,
+    jwt_decode_hs256,
     jwt_encode_hs256,
     make_archive_id,
     merge_dicts,
@@ -49,62 +50,76 @@ class VRTBaseIE(GigyaBaseIE):
     _JWT_SIGNING_KEY = 'b5f500d55cb44715107249ccd8a5c0136cfb2788dbb71b90a4f142423bacaf38'  # -dev
     # player-stag.vrt.be key:    d23987504521ae6fbf2716caca6700a24bb1579477b43c84e146b279de5ca595
     # player.vrt.be key:         2a9251d782700769fb856da5725daf38661874ca6f80ae7dc2b05ec1a81a24ae
+    _JSON_HEADERS = {'Content-Type': 'application/json'}
+
+    def _real_initialize(self):
+        # identity token -> (vrtPlayerToken, expiry timestamp)
+        self._player_tokens = {}
 
     def _extract_formats_and_subtitles(self, data, video_id):
         if traverse_obj(data, 'drm'):
             self.report_drm(video_id)
 
-        formats, subtitles = [], {}
-        for target in traverse_obj(data, ('targetUrls', lambda _, v: url_or_none(v['url']) and v['type'])):
-            format_type = target['type'].upper()
-            format_url = target['url']
-            if format_type in ('HLS', 'HLS_AES'):
-                fmts, subs = self._extract_m3u8_formats_and_subtitles(
-                    format_url, video_id, 'mp4', m3u8_id=format_type, fatal=False)
-                formats.extend(fmts)
-                self._merge_subtitles(subs, target=subtitles)
-            elif format_type == 'HDS':
-                formats.extend(self._extract_f4m_formats(
-                    format_url, video_id, f4m_id=format_type, fatal=False))
-            elif format_type == 'MPEG_DASH':
-                fmts, subs = self._extract_mpd_formats_and_subtitles(
-                    format_url, video_id, mpd_id=format_type, fatal=False)
-                formats.extend(fmts)
-                self._merge_subtitles(subs, target=subtitles)
-            elif format_type == 'HSS':
-                fmts, subs = self._extract_ism_formats_and_subtitles(
-                    format_url, video_id, ism_id='mss', fatal=False)
-                formats.extend(fmts)
-                self._merge_subtitles(subs, target=subtitles)
-            else:
-                formats.append({
-                    'format_id': format_type,
-                    'url': format_url,
-                })
+        results = [
+            self._extract_target_formats(target, video_id)
+            for target in traverse_obj(data, ('targetUrls', lambda _, v: url_or_none(v['url']) and v['type']))]
+
+        formats = [fmt for fmts, _ in results for fmt in fmts]
+        subtitles = self._merge_subtitles(*(subs for _, subs in results))
 
         for sub in traverse_obj(data, ('subtitleUrls', lambda _, v: v['url'] and v['type'] == 'CLOSED')):
             subtitles.setdefault('nl', []).append({'url': sub['url']})
 
         return formats, subtitles
 
-    def _call_api(self, video_id, client='null', id_token=None, version='v2'):
+    def _extract_target_formats(self, target, video_id):
+        format_type = target['type'].upper()
+        format_url = target['url']
+        if format_type in ('HLS', 'HLS_AES'):
+            return self._extract_m3u8_formats_and_subtitles(
+                format_url, video_id, 'mp4', m3u8_id=format_type, fatal=False)
+        elif format_type == 'HDS':
+            return self._extract_f4m_formats(
+                format_url, video_id, f4m_id=format_type, fatal=False), {}
+        elif format_type == 'MPEG_DASH':
+            return self._extract_mpd_formats_and_subtitles(
+                format_url, video_id, mpd_id=format_type, fatal=False)
+        elif format_type == 'HSS':
+            return self._extract_ism_formats_and_subtitles(
+                format_url, video_id, ism_id='mss', fatal=False)
+        return [{
+            'format_id': format_type,
+            'url': format_url,
+        }], {}
+
+    def _get_player_token(self, video_id, id_token=None):
+        player_token, expiry = self._player_tokens.get(id_token, (None, 0))
+        if player_token and time.time() < expiry:
+            return player_token
+
         player_info = {'exp': (round(time.time(), 3) + 900), **self._PLAYER_INFO}
         player_token = self._download_json(
             'https://media-services-public.vrt.be/vualto-video-aggregator-web/rest/external/v2/tokens',
             video_id, 'Downloading player token', headers={
                 **self.geo_verification_headers(),
-                'Content-Type': 'application/json',
+                **self._JSON_HEADERS,
             }, data=json.dumps({
                 'identityToken': id_token or {},
                 'playerInfo': jwt_encode_hs256(player_info, self._JWT_SIGNING_KEY, headers={
                     'kid': self._JWT_KEY_ID,
                 }).decode(),
             }, separators=(',', ':')).encode())['vrtPlayerToken']
+        # Only reuse tokens whose own exp claim can be read, leaving some leeway before it
+        expiry = traverse_obj(player_token, ({jwt_decode_hs256}, 'exp', {int_or_none}, {lambda x: x - 60}))
+        if expiry:
+            self._player_tokens[id_token] = (player_token, expiry)
+        return player_token
 
+    def _call_api(self, video_id, client='null', id_token=None, version='v2'):
         return self._download_json(
             f'https://media-services-public.vrt.be/media-aggregator/{version}/media-items/{video_id}',
             video_id, 'Downloading API JSON', query={
-                'vrtPlayerToken': player_token,
+                'vrtPlayerToken': self._get_player_token(video_id, id_token),
                 'client': client,
             }, expected_status=400)
 
@@ -229,6 +244,8 @@ class VrtNUIE(VRTBaseIE):
     }]
     _NETRC_MACHINE = 'vrtnu'
     _authenticated = False
+    _vrtnutoken = None
+    _vrtnutoken_expiry = 0
 
     def _perform_login(self, username, password):
         auth_info = self._gigya_login({
@@ -245,7 +262,7 @@ def _perform_login(self, username, password):
         # Sometimes authentication fails for no good reason, retry
         for retry in self.RetryManager():
             if retry.attempt > 1:
-                self._sleep(1, None)
+                self._sleep(0.25 * 2 ** (retry.attempt - 1), None)
             try:
                 self._request_webpage(
                     'https://token.vrt.be/vrtnuinitlogin', None, note='Requesting XSRF Token',
@@ -270,6 +287,20 @@ def _perform_login(self, username, password):
 
         self._authenticated = True
 
+    def _get_vrtnutoken(self, video_id):
+        if not self._authenticated:
+            return None
+        if self._vrtnutoken and time.time() < self._vrtnutoken_expiry:
+            return self._vrtnutoken
+
+        self._vrtnutoken = self._download_json(
+            'https://token.vrt.be/refreshtoken', video_id, note='Retrieving vrtnutoken',
+            errnote='Token refresh failed')['vrtnutoken']
+        # Tokens that cannot be decoded are not reused
+        self._vrtnutoken_expiry = traverse_obj(
+            self._vrtnutoken, ({jwt_decode_hs256}, 'exp', {int_or_none}, {lambda x: x - 60})) or 0
+        return self._vrtnutoken
+
     def _real_extract(self, url):
         display_id = self._match_id(url)
         parsed_url = urllib.parse.urlparse(url)
@@ -284,11 +315,7 @@ def _real_extract(self, url):
         if '$' not in video_id:
             raise ExtractorError('Unable to extract video ID')
 
-        vrtnutoken = self._download_json(
-            'https://token.vrt.be/refreshtoken', video_id, note='Retrieving vrtnutoken',
-            errnote='Token refresh failed')['vrtnutoken'] if self._authenticated else None
-
-        video_info = self._call_api(video_id, 'vrtnu-web@PROD', vrtnutoken)
+        video_info = self._call_api(video_id, 'vrtnu-web@PROD', self._get_vrtnutoken(video_id))
 
         if 'title' not in video_info:
             code = video_info.get('code')
@@ -303,22 +330,29 @@ def _real_extract(self, url):
             raise ExtractorError(code, expected=True)
 
         formats, subtitles = self._extract_formats_and_subtitles(video_info, video_id)
+        season_info = traverse_obj(details, ('data', 'season', {dict})) or {}
+        episode_info = traverse_obj(details, ('data', 'episode', {dict})) or {}
+        timestamp = traverse_obj(episode_info, ('onTime', 'raw', {parse_iso8601}))
 
         return {
             **traverse_obj(details, {
                 'title': 'title',
                 'description': ('description', {clean_html}),
-                'timestamp': ('data', 'episode', 'onTime', 'raw', {parse_iso8601}),
-                'release_timestamp': ('data', 'episode', 'onTime', 'raw', {parse_iso8601}),
                 'series': ('data', 'program', 'title'),
-                'season': ('data', 'season', 'title', 'value'),
-                'season_number': ('data', 'season', 'title', 'raw', {int_or_none}),
-                'season_id': ('data', 'season', 'id', {str_or_none}),
-                'episode': ('data', 'episode', 'number', 'value', {str_or_none}),
-                'episode_number': ('data', 'episode', 'number', 'raw', {int_or_none}),
-                'episode_id': ('data', 'episode', 'id', {str_or_none}),
-                'age_limit': ('data', 'episode', 'age', 'raw', {parse_age_limit}),
             }),
+            **traverse_obj(season_info, {
+                'season': ('title', 'value'),
+                'season_number': ('title', 'raw', {int_or_none}),
+                'season_id': ('id', {str_or_none}),
+            }),
+            **traverse_obj(episode_info, {
+                'episode': ('number', 'value', {str_or_none}),
+                'episode_number': ('number', 'raw', {int_or_none}),
+                'episode_id': ('id', {str_or_none}),
+                'age_limit': ('age', 'raw', {parse_age_limit}),
+            }),
+            'timestamp': timestamp,
+            'release_timestamp': timestamp,
             'id': video_id,
             'display_id': display_id,
             'channel': 'VRT',